@@ -24,19 +24,94 @@ __date__ = '16.10.2025'
 __url__ = "https://github.com/paulotto/jaw_tracking_system"
 
 import sys
+import importlib.util
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import h5py
 import numpy as np
 import matplotlib.pyplot as plt
 
 # Add parent directory to path if jts module is not installed
-try:
-    import jts.helper as hlp
-except ModuleNotFoundError:
-    # Add the parent directory to the Python path
-    script_dir = Path(__file__).resolve().parent
-    parent_dir = script_dir.parent
-    sys.path.insert(0, str(parent_dir))
-    import jts.helper as hlp
+if importlib.util.find_spec('jts') is None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jts.helper as hlp
+
+
+def _load_group(h5_file, group_name, precompute_euler):
+    """
+    Load a single group into memory.
+
+    Meant to run on a worker thread, so reading the next group overlaps with
+    printing the statistics of the current one.
+    """
+    return hlp.load_hdf5_transformations(h5_file, group_name=group_name, as_matrices=True,
+                                         precompute_euler=precompute_euler)[group_name]
+
+
+def _print_group_summary(group_name, group_data):
+    """Print shape, timing, translation range and derivative statistics of a loaded group."""
+    print(f"\nGroup: {group_name}")
+    print(f"  Transformations shape: {group_data['transformations'].shape}")
+    print(f"  Sample rate: {group_data['sample_rate']} Hz")
+    print(f"  Unit: {group_data['unit']}")
+    print(f"  Duration: {len(group_data['transformations']) / group_data['sample_rate']:.2f} seconds")
+
+    # Calculate trajectory statistics
+    translations = group_data['translations']
+    tmin, tmax = translations.min(axis=0), translations.max(axis=0)
+    print(f"  Translation range (XYZ min): {np.array2string(tmin, precision=2, floatmode='fixed', separator=', ')} {group_data['unit']}")
+    print(f"  Translation range (XYZ max): {np.array2string(tmax, precision=2, floatmode='fixed', separator=', ')} {group_data['unit']}")
+
+    # Check for derivatives
+    derivs = group_data.get('derivatives') or {}
+    if derivs:
+        print("  Derivatives available:")
+    
+        # Translational derivatives
+        if 'translational_velocity' in derivs:
+            trans_vel = derivs['translational_velocity']
+            vel_min, vel_max, vel_mean = hlp.mag_minmaxmean(trans_vel)
+            print("    - Translational velocity (1st derivative):")
+            print(f"      Shape: {trans_vel.shape}")
+            print(f"      Magnitude range: [{vel_min:.4f}, {vel_max:.4f}] {group_data['unit']}/s")
+            print(f"      Mean magnitude: {vel_mean:.4f} {group_data['unit']}/s")
+    
+        if 'translational_acceleration' in derivs:
+            trans_acc = derivs['translational_acceleration']
+            acc_min, acc_max, acc_mean = hlp.mag_minmaxmean(trans_acc)
+            print("    - Translational acceleration (2nd derivative):")
+            print(f"      Shape: {trans_acc.shape}")
+            print(f"      Magnitude range: [{acc_min:.4f}, {acc_max:.4f}] {group_data['unit']}/s²")
+            print(f"      Mean magnitude: {acc_mean:.4f} {group_data['unit']}/s²")
+    
+        # Rotational derivatives
+        if 'angular_velocity' in derivs:
+            ang_vel = derivs['angular_velocity']
+            ang_vel_min, ang_vel_max, ang_vel_mean = hlp.mag_minmaxmean(ang_vel)
+            print("    - Angular velocity (1st rotational derivative):")
+            print(f"      Shape: {ang_vel.shape}")
+            print(f"      Magnitude range: [{ang_vel_min:.4f}, {ang_vel_max:.4f}] rad/s")
+            print(f"      Mean magnitude: {ang_vel_mean:.4f} rad/s")
+    
+        if 'angular_acceleration' in derivs:
+            ang_acc = derivs['angular_acceleration']
+            ang_acc_min, ang_acc_max, ang_acc_mean = hlp.mag_minmaxmean(ang_acc)
+            print("    - Angular acceleration (2nd rotational derivative):")
+            print(f"      Shape: {ang_acc.shape}")
+            print(f"      Magnitude range: [{ang_acc_min:.4f}, {ang_acc_max:.4f}] rad/s²")
+            print(f"      Mean magnitude: {ang_acc_mean:.4f} rad/s²")
+    
+        # Show any other derivatives
+        other_derivs = [k for k in derivs 
+                      if k not in {'translational_velocity', 'translational_acceleration',
+                                   'angular_velocity', 'angular_acceleration',
+                                   'velocity', 'acceleration',  # backward compat aliases
+                                   'rotational_velocity', 'rotational_acceleration'}]  # other aliases
+        if other_derivs:
+            print(f"    - Other derivatives: {', '.join(other_derivs)}")
+    else:
+        print("  Derivatives: None")
 
 
 def main():
@@ -60,84 +135,63 @@ def main():
     print("="*80)
     print()
     
-    # ========================================================================
-    # 1. INSPECT THE HDF5 FILE
-    # ========================================================================
-    print("STEP 1: Inspecting HDF5 file structure")
-    print("-" * 80)
+    # Open the file once (with a larger raw-chunk cache than the 1 MB default)
+    # and share the handle between inspection and loading. All data is in
+    # memory afterwards, so the file is closed before plotting.
+    with h5py.File(hdf5_file, 'r', rdcc_nbytes=64 * 1024 * 1024) as h5_file:
+        # ========================================================================
+        # 1. INSPECT THE HDF5 FILE
+        # ========================================================================
+        print("STEP 1: Inspecting HDF5 file structure")
+        print("-" * 80)
     
-    _info = hlp.inspect_hdf5(hdf5_file, verbose=True)
+        info = hlp.inspect_hdf5(h5_file, verbose=True)
     
-    # ========================================================================
-    # 2. LOAD TRANSFORMATION DATA
-    # ========================================================================
-    print("\nSTEP 2: Loading transformation data")
-    print("-" * 80)
+        # ========================================================================
+        # 2. LOAD TRANSFORMATION DATA
+        # ========================================================================
+        print("\nSTEP 2: Loading transformation data")
+        print("-" * 80)
     
-    data = hlp.load_hdf5_transformations(hdf5_file, as_matrices=True)
+        # Each group is read once; the loaded data is reused by all plots below.
+        # The next group is prefetched on a background thread while the
+        # statistics of the current group are computed and printed.
+        group_names = list(info.keys())
+        data = {}
     
-    for group_name, group_data in data.items():
-        print(f"\nGroup: {group_name}")
-        print(f"  Transformations shape: {group_data['transformations'].shape}")
-        print(f"  Sample rate: {group_data['sample_rate']} Hz")
-        print(f"  Unit: {group_data['unit']}")
-        print(f"  Duration: {len(group_data['transformations']) / group_data['sample_rate']:.2f} seconds")
-        
-        # Calculate trajectory statistics
-        translations = group_data['translations']
-        print("  Translation range:")
-        print(f"    X: [{translations[:, 0].min():.2f}, {translations[:, 0].max():.2f}] {group_data['unit']}")
-        print(f"    Y: [{translations[:, 1].min():.2f}, {translations[:, 1].max():.2f}] {group_data['unit']}")
-        print(f"    Z: [{translations[:, 2].min():.2f}, {translations[:, 2].max():.2f}] {group_data['unit']}")
-        
-        # Check for derivatives
-        if 'derivatives' in group_data and group_data['derivatives']:
-            print("  Derivatives available:")
-            
-            # Translational derivatives
-            if 'translational_velocity' in group_data['derivatives']:
-                trans_vel = group_data['derivatives']['translational_velocity']
-                vel_magnitude = np.linalg.norm(trans_vel, axis=1)
-                print("    - Translational velocity (1st derivative):")
-                print(f"      Shape: {trans_vel.shape}")
-                print(f"      Magnitude range: [{vel_magnitude.min():.4f}, {vel_magnitude.max():.4f}] {group_data['unit']}/s")
-                print(f"      Mean magnitude: {vel_magnitude.mean():.4f} {group_data['unit']}/s")
-            
-            if 'translational_acceleration' in group_data['derivatives']:
-                trans_acc = group_data['derivatives']['translational_acceleration']
-                acc_magnitude = np.linalg.norm(trans_acc, axis=1)
-                print("    - Translational acceleration (2nd derivative):")
-                print(f"      Shape: {trans_acc.shape}")
-                print(f"      Magnitude range: [{acc_magnitude.min():.4f}, {acc_magnitude.max():.4f}] {group_data['unit']}/s²")
-                print(f"      Mean magnitude: {acc_magnitude.mean():.4f} {group_data['unit']}/s²")
-            
-            # Rotational derivatives
-            if 'angular_velocity' in group_data['derivatives']:
-                ang_vel = group_data['derivatives']['angular_velocity']
-                ang_vel_magnitude = np.linalg.norm(ang_vel, axis=1) if ang_vel.ndim > 1 else np.abs(ang_vel)
-                print("    - Angular velocity (1st rotational derivative):")
-                print(f"      Shape: {ang_vel.shape}")
-                print(f"      Magnitude range: [{ang_vel_magnitude.min():.4f}, {ang_vel_magnitude.max():.4f}] rad/s")
-                print(f"      Mean magnitude: {ang_vel_magnitude.mean():.4f} rad/s")
-            
-            if 'angular_acceleration' in group_data['derivatives']:
-                ang_acc = group_data['derivatives']['angular_acceleration']
-                ang_acc_magnitude = np.linalg.norm(ang_acc, axis=1) if ang_acc.ndim > 1 else np.abs(ang_acc)
-                print("    - Angular acceleration (2nd rotational derivative):")
-                print(f"      Shape: {ang_acc.shape}")
-                print(f"      Magnitude range: [{ang_acc_magnitude.min():.4f}, {ang_acc_magnitude.max():.4f}] rad/s²")
-                print(f"      Mean magnitude: {ang_acc_magnitude.mean():.4f} rad/s²")
+        # Euler angles are only plotted when comparing multiple groups (step 4);
+        # cache them once at load time for the comparison plots
+        precompute_euler = len(group_names) > 1
+    
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(_load_group, h5_file, group_names[0], precompute_euler)
+            for idx, group_name in enumerate(group_names):
+                group_data = data[group_name] = future.result()
+                if idx + 1 < len(group_names):
+                    future = executor.submit(_load_group, h5_file, group_names[idx + 1], precompute_euler)
             
-            # Show any other derivatives
-            other_derivs = [k for k in group_data['derivatives'].keys() 
-                          if k not in ['translational_velocity', 'translational_acceleration',
-                                      'angular_velocity', 'angular_acceleration',
-                                      'velocity', 'acceleration',  # backward compat aliases
-                                      'rotational_velocity', 'rotational_acceleration']]  # other aliases
-            if other_derivs:
-                print(f"    - Other derivatives: {', '.join(other_derivs)}")
-        else:
-            print("  Derivatives: None")
+                _print_group_summary(group_name, group_data)
+    
+    # Get the first (or only) group for visualization
+    first_group = group_names[0]
+    
+    # Decide which components to compare (if multiple groups are available)
+    components = []
+    if len(data) > 1:
+        components = ['translations', 'rotations_euler']
+        first_derivs = set(data[first_group].get('derivatives') or ())
+        if 'translational_velocity' in first_derivs:
+            components.append('translational_velocity')
+            if 'angular_velocity' in first_derivs:
+                components.append('angular_velocity')
+    
+    # Build a single figure: 3D trajectory on the left, one column of X/Y/Z
+    # subplots per comparison component on the right
+    fig = plt.figure(figsize=(8 + 5 * len(components), 10), layout='constrained')
+    if components:
+        fig_3d, fig_compare = fig.subfigures(1, 2, width_ratios=[2, len(components)])
+    else:
+        fig_3d = fig
     
     # ========================================================================
     # 3. VISUALIZE 3D TRAJECTORY
@@ -145,15 +199,20 @@ def main():
     print("\n\nSTEP 3: Visualizing 3D trajectory")
     print("-" * 80)
     
-    # Get the first (or only) group for visualization
-    first_group = list(data.keys())[0]
+    # Decimate the trajectory line to roughly screen resolution (~5k points)
+    n_frames = len(data[first_group]['translations'])
+    stride = max(1, n_frames // 5000)
     
-    fig, ax = hlp.visualize_hdf5_trajectory(
+    hlp.visualize_hdf5_trajectory(
         hdf5_file,
         group_name=first_group,
         frame_step=500,  # Show coordinate frame every 500 frames (~24 frames for better visibility)
         show_frames=True,
-        frame_scale=None  # Auto-calculate scale based on trajectory size (3% of trajectory range)
+        frame_scale=None,  # Auto-calculate scale based on trajectory size (3% of trajectory range)
+        stride=stride,  # Plot every N-th sample of the trajectory line
+        rasterized=True,  # Rasterize dense line/frame artists in vector exports
+        data=data,  # Reuse loaded data instead of re-reading the file
+        ax=fig_3d.add_subplot(projection='3d')
     )
     
     print(f"Created 3D trajectory plot for: {first_group}")
@@ -161,47 +220,22 @@ def main():
     # ========================================================================
     # 4. COMPARE MULTIPLE TRAJECTORIES (if available)
     # ========================================================================
-    if len(data) > 1:
+    if components:
         print("\n\nSTEP 4: Comparing trajectories")
         print("-" * 80)
         
-        group_names = list(data.keys())
         print(f"Comparing groups: {group_names}")
         
-        # Compare translations
-        fig_trans, axes_trans = hlp.compare_hdf5_trajectories(
+        # All components in one shared-x subplot grid (layout computed once)
+        hlp.compare_hdf5_trajectories_multi(
             hdf5_file,
             group_names=group_names,
-            component='translations'
+            components=components,
+            data=data,
+            fig=fig_compare
         )
         
-        # Compare rotations (Euler angles)
-        fig_rot, axes_rot = hlp.compare_hdf5_trajectories(
-            hdf5_file,
-            group_names=group_names,
-            component='rotations_euler'
-        )
-        
-        # Compare translational velocities (if derivatives available)
-        first_group_data = data[group_names[0]]
-        if 'derivatives' in first_group_data and 'translational_velocity' in first_group_data['derivatives']:
-            fig_vel, axes_vel = hlp.compare_hdf5_trajectories(
-                hdf5_file,
-                group_names=group_names,
-                component='translational_velocity'
-            )
-            print("Created comparison plots for translations, rotations, and translational velocity")
-            
-            # Compare angular velocities
-            if 'angular_velocity' in first_group_data['derivatives']:
-                fig_ang_vel, axes_ang_vel = hlp.compare_hdf5_trajectories(
-                    hdf5_file,
-                    group_names=group_names,
-                    component='angular_velocity'
-                )
-                print("Added comparison plot for angular velocity")
-        else:
-            print("Created comparison plots for translations and rotations")
+        print(f"Created comparison plots for: {', '.join(components)}")
     else:
         print("\n\nSTEP 4: Skipped (only one trajectory group found)")
     
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+_kernels.py: Numerical kernels for trajectory statistics.
+
+Uses Numba for fused, multi-threaded kernels on large arrays if it is
+installed and falls back to block-wise NumPy implementations otherwise.
+"""
+
+__author__ = "Paul-Otto Müller"
+__copyright__ = "Copyright 2025, Paul-Otto Müller"
+__credits__ = ["Paul-Otto Müller"]
+__license__ = "CC BY-NC-SA 4.0"
+__version__ = "1.1.0"
+__maintainer__ = "Paul-Otto Müller"
+__status__ = "Development"
+__date__ = '16.10.2025'
+__url__ = "https://github.com/paulotto/jaw_tracking_system"
+
+import os
+import importlib.util
+import numpy as np
+
+from typing import Tuple
+
+# Numba is imported (and the kernel compiled) only on first use, keeping module imports fast
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Number of rows reduced at once by the NumPy fallback
+BLOCK_SIZE = 65536
+
+# Minimum number of rows for which the Numba kernel is used; below, its JIT compilation
+# and thread start-up cost more than the NumPy implementation takes
+NUMBA_MIN_ROWS = 1_000_000
+
+_numba_kernel = None
+
+
+def _mag_minmaxmean_numpy(a: np.ndarray) -> Tuple[float, float, float]:
+    """Block-wise NumPy implementation of mag_minmaxmean()."""
+    sq_min, sq_max, mag_sum = np.inf, -np.inf, 0.0
+    for start in range(0, len(a), BLOCK_SIZE):
+        block = a[start:start + BLOCK_SIZE]
+        sq = np.einsum('ij,ij->i', block, block)
+        sq_min = np.minimum(sq_min, sq.min())  # NaN-propagating, unlike builtin min()/max()
+        sq_max = np.maximum(sq_max, sq.max())
+        mag_sum += np.sqrt(sq, out=sq).sum()
+    return float(np.sqrt(sq_min)), float(np.sqrt(sq_max)), float(mag_sum / len(a))
+
+
+def _get_numba_kernel():
+    """Import Numba and compile the kernel of mag_minmaxmean() on first call."""
+    global _numba_kernel
+    if _numba_kernel is not None:
+        return _numba_kernel
+
+    from numba import njit, prange
+
+    # Fast-math without 'nnan'/'ninf', so NaN/inf rows are handled like in the NumPy path
+    @njit(parallel=True, fastmath={'contract', 'arcp', 'reassoc'}, cache=True)
+    def kernel(a, n_blocks):
+        """
+        Fused sqrt + min/max/sum over row norms, one partial result per block and thread.
+
+        Returns the per-block squared-norm minima/maxima and norm sums; the final
+        reduction is left to NumPy, as Numba's parallel array reductions drop NaN.
+        """
+        n, d = a.shape
+        block_size = (n + n_blocks - 1) // n_blocks
+        lo = np.full(n_blocks, np.inf)
+        hi = np.full(n_blocks, -np.inf)
+        total = np.zeros(n_blocks)
+
+        for b in prange(n_blocks):
+            for i in range(b * block_size, min(n, (b + 1) * block_size)):
+                s = 0.0
+                for j in range(d):
+                    s += a[i, j] * a[i, j]
+                lo[b] = np.minimum(lo[b], s)
+                hi[b] = np.maximum(hi[b], s)
+                total[b] += np.sqrt(s)
+
+        return lo, hi, total
+
+    _numba_kernel = kernel
+    return _numba_kernel
+
+
+def _mag_minmaxmean_numba(a: np.ndarray) -> Tuple[float, float, float]:
+    """Multi-threaded Numba implementation of mag_minmaxmean()."""
+    n_blocks = min(len(a), 4 * (os.cpu_count() or 1))
+    lo, hi, total = _get_numba_kernel()(np.ascontiguousarray(a), n_blocks)
+    return float(np.sqrt(lo.min())), float(np.sqrt(hi.max())), float(total.sum() / len(a))
+
+
+def mag_minmaxmean(a: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Compute min, max and mean of the per-row Euclidean norm of an array.
+
+    Args:
+        a: Array of shape (N, D), e.g. velocities or accelerations (1D arrays are treated as (N, 1))
+
+    Returns:
+        Tuple of (min, max, mean) magnitude. All three are NaN if any row contains NaN,
+        matching reductions over np.linalg.norm(a, axis=1).
+
+    Arrays with at least NUMBA_MIN_ROWS rows use the Numba kernel if Numba is installed.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    a = a.reshape(len(a), -1)
+    if len(a) == 0:
+        raise ValueError("Cannot compute magnitude statistics of an empty array")
+
+    if NUMBA_AVAILABLE and len(a) >= NUMBA_MIN_ROWS:
+        return _mag_minmaxmean_numba(a)
+
+    return _mag_minmaxmean_numpy(a)
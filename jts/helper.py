@@ -22,17 +22,21 @@ import csv
 import numpy as np
 import logging
 import sys
+import warnings
 from pathlib import Path
+from contextlib import contextmanager
 
 import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+from matplotlib.figure import Figure, SubFigure
 from matplotlib.axes import Axes
 
-from typing import List, Dict, Tuple, Optional, Union
+from typing import List, Dict, Tuple, Optional, Union, Iterator, Sequence
 
 from scipy.signal import savgol_filter
 from scipy.spatial.transform import Rotation as R
 
+from ._kernels import mag_minmaxmean  # noqa: F401 # Re-exported as part of the helper API
+
 # Global variable to enable PGF/LaTeX output for matplotlib
 USE_TEX_FONT = False  # Set to True to enable PGF/LaTeX output globally
 
@@ -946,12 +950,37 @@ def relative_rotation(q1: np.ndarray, q2: np.ndarray,
 # HDF5 File Loading and Inspection Functions
 # ============================================================================
 
-def inspect_hdf5(filename: Union[str, Path], verbose: bool = True) -> Dict[str, Dict[str, any]]:  # type: ignore
+# Chunks holding fewer frames/bytes than this make full-trajectory reads slow
+MIN_CHUNK_FRAMES = 256
+MIN_CHUNK_BYTES = 4096
+
+
+@contextmanager
+def _open_hdf5(filename: Union[str, Path, h5py.File], **kwargs) -> Iterator[h5py.File]:
+    """
+    Open an HDF5 file for reading, or pass through an already open file handle.
+
+    Handles passed in are not closed on exit, so callers can share a single
+    open file across several inspection/loading calls.
+    """
+    if isinstance(filename, h5py.File):
+        yield filename
+        return
+
+    filename = Path(filename)
+    if not filename.exists():
+        raise FileNotFoundError(f"HDF5 file not found: {filename}")
+
+    with h5py.File(filename, 'r', **kwargs) as f:
+        yield f
+
+
+def inspect_hdf5(filename: Union[str, Path, h5py.File], verbose: bool = True) -> Dict[str, Dict[str, any]]:  # type: ignore
     """
     Inspect an HDF5 file and return comprehensive information about its contents.
 
     Args:
-        filename: Path to HDF5 file
+        filename: Path to HDF5 file or an open h5py.File handle
         verbose: If True, print detailed information to console
 
     Returns:
@@ -961,16 +990,12 @@ def inspect_hdf5(filename: Union[str, Path], verbose: bool = True) -> Dict[str,
         >>> info = hlp.inspect_hdf5('jaw_motion.h5')
         >>> print(info['T_model_origin_mand_landmark_t']['num_frames'])
     """
-    filename = Path(filename)
-    if not filename.exists():
-        raise FileNotFoundError(f"HDF5 file not found: {filename}")
-
     info = {}
 
-    with h5py.File(filename, 'r') as f:
+    with _open_hdf5(filename) as f:
         if verbose:
             print(f"\n{'='*80}")
-            print(f"HDF5 File: {filename}")
+            print(f"HDF5 File: {f.filename}")
             print(f"{'='*80}\n")
 
         for group_name in f.keys():
@@ -989,9 +1014,19 @@ def inspect_hdf5(filename: Union[str, Path], verbose: bool = True) -> Dict[str,
                 datasets[dataset_name] = {
                     'shape': dataset.shape,  # type: ignore
                     'dtype': dataset.dtype,  # type: ignore
-                    'size_mb': dataset.size * dataset.dtype.itemsize / (1024 * 1024)  # type: ignore
+                    'size_mb': dataset.size * dataset.dtype.itemsize / (1024 * 1024),  # type: ignore
+                    'chunks': dataset.chunks  # type: ignore
                 }
 
+                # Warn about chunk layouts that make reading whole trajectories slow
+                # (not if a single chunk already covers all frames)
+                if dataset.chunks is not None and dataset.chunks[0] < dataset.shape[0]:  # type: ignore
+                    chunk_bytes = int(np.prod(dataset.chunks)) * dataset.dtype.itemsize  # type: ignore
+                    if chunk_bytes < MIN_CHUNK_BYTES:
+                        logger.warning(f"Dataset '{group_name}/{dataset_name}' uses small chunks "
+                                       f"{dataset.chunks} ({chunk_bytes} bytes); consider repacking "
+                                       f"with >= {MIN_CHUNK_BYTES} bytes per chunk")
+
             group_info['datasets'] = datasets
 
             # Determine number of frames
@@ -1033,7 +1068,8 @@ def inspect_hdf5(filename: Union[str, Path], verbose: bool = True) -> Dict[str,
                 print(f"  Derivative Order: {group_info['derivative_order']}")
                 print("  Datasets:")
                 for ds_name, ds_info in datasets.items():
-                    print(f"    - {ds_name}: shape={ds_info['shape']}, dtype={ds_info['dtype']}, size={ds_info['size_mb']:.3f} MB")
+                    print(f"    - {ds_name}: shape={ds_info['shape']}, dtype={ds_info['dtype']}, size={ds_info['size_mb']:.3f} MB"
+                          + (f", chunks={ds_info['chunks']}" if ds_info['chunks'] else ""))
                 print()
 
         if verbose:
@@ -1042,16 +1078,82 @@ def inspect_hdf5(filename: Union[str, Path], verbose: bool = True) -> Dict[str,
     return info
 
 
-def load_hdf5_transformations(filename: Union[str, Path],
+def _read_dataset(dataset: h5py.Dataset) -> np.ndarray:
+    """
+    Read a complete dataset with a single contiguous read into a preallocated buffer.
+
+    Logs a warning if the dataset is chunked with fewer than MIN_CHUNK_FRAMES
+    frames per chunk (or fewer than all frames for shorter recordings), as such
+    files are better repacked before analysis.
+    """
+    if dataset.chunks is not None and dataset.chunks[0] < min(MIN_CHUNK_FRAMES, dataset.shape[0]):
+        logger.warning(f"Dataset '{dataset.name}' uses small chunks {dataset.chunks}; "
+                       f"consider repacking with >= {MIN_CHUNK_FRAMES} frames per chunk for faster loading")
+
+    buffer = np.empty(dataset.shape, dtype=dataset.dtype)
+    if dataset.size:
+        dataset.read_direct(buffer)
+    return buffer
+
+
+def _to_rotation_matrices(rotations: np.ndarray) -> np.ndarray:
+    """Convert scalar-first quaternions (N, 4) to rotation matrices (N, 3, 3); matrices pass through."""
+    rotations = np.asarray(rotations)
+    if rotations.ndim == 2 and rotations.shape[1] == 4:
+        return R.from_quat(rotations[:, [1, 2, 3, 0]]).as_matrix()  # scalar-first -> scipy format
+    return rotations
+
+
+def _to_euler_angles(rotations: np.ndarray) -> np.ndarray:
+    """
+    Convert scalar-first quaternions (N, 4) or rotation matrices (N, 3, 3) to 'xyz' Euler angles in degrees.
+
+    Rows that are no valid rotation (non-finite, zero-norm quaternions or matrices with
+    non-positive determinant, e.g. tracking dropouts) give NaN instead of raising, and
+    scipy's gimbal lock warning is silenced.
+    """
+    rotations = np.asarray(rotations, dtype=np.float64)
+    valid = np.isfinite(rotations.reshape(len(rotations), -1)).all(axis=1)
+    if rotations.ndim == 2:
+        valid[valid] = np.linalg.norm(rotations[valid], axis=1) > 0
+    else:
+        valid[valid] = np.linalg.det(rotations[valid]) > 0
+
+    euler = np.full((len(rotations), 3), np.nan)
+    if valid.any():
+        if rotations.ndim == 2:
+            rotation = R.from_quat(rotations[valid][:, [1, 2, 3, 0]])  # scalar-first -> scipy format
+        else:
+            rotation = R.from_matrix(rotations[valid])
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='Gimbal lock detected')
+            euler[valid] = rotation.as_euler('xyz', degrees=True)
+    return euler
+
+
+def load_hdf5_transformations(filename: Union[str, Path, h5py.File],
                               group_name: Optional[str] = None,
-                              as_matrices: bool = True) -> Dict[str, any]:  # type: ignore
+                              as_matrices: bool = True,
+                              chunk_cache_mb: Optional[float] = None,
+                              lazy: bool = False,
+                              precompute_euler: bool = True) -> Dict[str, any]:  # type: ignore
     """
     Load transformation data from HDF5 file.
 
     Args:
-        filename: Path to HDF5 file
+        filename: Path to HDF5 file or an open h5py.File handle
         group_name: Specific group to load (None = load all groups)
         as_matrices: If True, convert quaternions to rotation matrices
+        chunk_cache_mb: Size of the HDF5 raw-chunk cache in MB (None = h5py default of 1 MB).
+            Ignored if an already open file handle is passed.
+        lazy: If True, return h5py.Dataset objects instead of reading arrays into memory.
+            Rotations stay in their stored format, 'transformations' is not built and
+            as_matrices is ignored. Requires an open h5py.File handle, which must stay
+            open (and be closed by the caller) as long as the datasets are in use.
+        precompute_euler: If True, compute 'xyz' Euler angles (degrees) for all frames once
+            and store them as 'rotations_euler' (NaN for frames without a valid rotation).
+            Not available with lazy=True; set to False to skip the conversion if no
+            Euler angles are needed.
 
     Returns:
         Dictionary containing transformation data:
@@ -1060,6 +1162,7 @@ def load_hdf5_transformations(filename: Union[str, Path],
                 'transformations': np.ndarray (N, 4, 4) - Homogeneous transformation matrices
                 'translations': np.ndarray (N, 3) - Translation vectors
                 'rotations': np.ndarray (N, 3, 3) or (N, 4) - Rotation matrices or quaternions
+                'rotations_euler': np.ndarray (N, 3) - 'xyz' Euler angles in degrees (if precompute_euler)
                 'sample_rate': float - Sample rate in Hz
                 'unit': str - Unit of translations
                 'metadata': str - Metadata string
@@ -1088,13 +1191,17 @@ def load_hdf5_transformations(filename: Union[str, Path],
         ...     ang_vel = group['derivatives']['angular_velocity']
         ...     print(f"Max angular velocity: {np.linalg.norm(ang_vel, axis=1).max():.3f} rad/s")
     """
-    filename = Path(filename)
-    if not filename.exists():
-        raise FileNotFoundError(f"HDF5 file not found: {filename}")
-
     results = {}
 
-    with h5py.File(filename, 'r') as f:
+    cache_kwargs = {}
+    if chunk_cache_mb is not None:
+        cache_kwargs = {'rdcc_nbytes': int(chunk_cache_mb * 1024 * 1024), 'rdcc_nslots': 10007}
+
+    if lazy and not isinstance(filename, h5py.File):
+        raise ValueError("lazy=True requires an open h5py.File handle, as the returned datasets "
+                         "are only readable while the file is open")
+
+    with _open_hdf5(filename, **cache_kwargs) as f:
         groups_to_load = [group_name] if group_name else list(f.keys())
 
         for gname in groups_to_load:
@@ -1107,31 +1214,31 @@ def load_hdf5_transformations(filename: Union[str, Path],
 
             # Load translations
             if 'translations' in group:  # type: ignore
-                data['translations'] = group['translations'][:]  # type: ignore
+                data['translations'] = group['translations'] if lazy else _read_dataset(group['translations'])  # type: ignore
             else:
                 raise ValueError(f"Group '{gname}' does not contain 'translations' dataset")
 
             # Load rotations
             if 'rotations' in group:  # type: ignore
-                rotations_data = group['rotations'][:]  # type: ignore
+                if lazy:
+                    data['rotations'] = group['rotations']  # type: ignore
+                else:
+                    rotations_data = _read_dataset(group['rotations'])  # type: ignore
 
-                # Determine format and convert if needed
-                if rotations_data.shape[1] == 4:  # type: ignore # Quaternions (scalar-first format)
+                    # Convert quaternions (scalar-first format) to rotation matrices if requested
                     if as_matrices:
-                        # Convert quaternions to rotation matrices
-                        data['rotations'] = np.array([
-                            R.from_quat(q[[1, 2, 3, 0]]).as_matrix()  # Convert from scalar-first to scipy format
-                            for q in rotations_data  # type: ignore
-                        ])
+                        data['rotations'] = _to_rotation_matrices(rotations_data)
                     else:
                         data['rotations'] = rotations_data
-                else:  # Already rotation matrices
-                    data['rotations'] = rotations_data
             else:
                 raise ValueError(f"Group '{gname}' does not contain 'rotations' dataset")
 
+            # Cache Euler angles (vectorized over all frames) for plotting and analysis
+            if precompute_euler and not lazy:
+                data['rotations_euler'] = _to_euler_angles(data['rotations'])
+
             # Construct 4x4 transformation matrices
-            if as_matrices:
+            if as_matrices and not lazy:
                 if data['rotations'].ndim == 3:  # type: ignore # Already matrices
                     N = len(data['translations'])  # type: ignore
                     data['transformations'] = np.zeros((N, 4, 4))
@@ -1157,7 +1264,7 @@ def load_hdf5_transformations(filename: Union[str, Path],
             derivatives = {}
             for key in group.keys():  # type: ignore
                 if 'derivative' in key.lower():
-                    deriv_data = group[key][:]  # type: ignore
+                    deriv_data = group[key] if lazy else _read_dataset(group[key])  # type: ignore
                     # Provide both original key and simplified access
                     derivatives[key] = deriv_data
                     
@@ -1194,24 +1301,51 @@ def load_hdf5_transformations(filename: Union[str, Path],
     return results
 
 
-def visualize_hdf5_trajectory(filename: Union[str, Path],
+def _save_figure(fig: Union[Figure, SubFigure], save_path: Union[str, Path]) -> Path:
+    """
+    Save a figure, creating parent directories as needed.
+
+    Subfigures cannot be saved on their own, so the top-level figure they belong to is saved.
+    """
+    save_path = Path(save_path)
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    while isinstance(fig, SubFigure):
+        fig = fig.figure  # type: ignore
+    fig.savefig(save_path, dpi=300, bbox_inches='tight')
+    return save_path
+
+
+def visualize_hdf5_trajectory(filename: Union[str, Path, h5py.File],
                               group_name: Optional[str] = None,
                               frame_step: int = 100,
                               show_frames: bool = True,
                               frame_scale: Optional[float] = None,
                               save_path: Optional[Union[str, Path]] = None,
-                              title: Optional[str] = None) -> Tuple[Figure, Axes]:
+                              title: Optional[str] = None,
+                              stride: int = 1,
+                              data: Optional[Dict[str, any]] = None,  # type: ignore
+                              ax: Optional[Axes] = None,
+                              rasterized: bool = False) -> Tuple[Figure, Axes]:
     """
     Visualize trajectory from HDF5 file in 3D.
 
     Args:
-        filename: Path to HDF5 file
+        filename: Path to HDF5 file or an open h5py.File handle
         group_name: Specific group to visualize (None = first group)
         frame_step: Plot coordinate frame every N frames
         show_frames: Whether to show coordinate frames along trajectory
         frame_scale: Scale factor for coordinate frame arrows (None = auto-calculate as 3% of trajectory range)
         save_path: Optional path to save the figure
         title: Plot title (auto-generated if None)
+        stride: Plot only every N-th sample of the trajectory line (1 = all samples),
+            plus the last sample. Useful to keep long recordings responsive; start/end
+            markers and coordinate frames still use the full-resolution data.
+        data: Data already returned by load_hdf5_transformations(as_matrices=True).
+            If given, the file is not read again.
+        ax: Existing 3D axes to draw into (None = create a new figure).
+            Allows combining several plots in one figure.
+        rasterized: Rasterize the trajectory line and coordinate frames when saving to
+            vector formats (PDF/SVG), keeping files small and fast to render for dense trajectories.
 
     Returns:
         Figure and Axes objects
@@ -1221,7 +1355,8 @@ def visualize_hdf5_trajectory(filename: Union[str, Path],
         >>> plt.show()
     """
     # Load data
-    data = load_hdf5_transformations(filename, group_name, as_matrices=True)
+    if data is None:
+        data = load_hdf5_transformations(filename, group_name, as_matrices=True, precompute_euler=False)
 
     if not data:
         raise ValueError(f"No data loaded from {filename}")
@@ -1233,60 +1368,74 @@ def visualize_hdf5_trajectory(filename: Union[str, Path],
     if group_name not in data:
         raise ValueError(f"Group '{group_name}' not found in loaded data")
 
+    if stride < 1:
+        raise ValueError("stride must be >= 1")
+
     group_data = data[group_name]
-    T_t = group_data['transformations']
+    translations = group_data['translations']  # np.ndarray, or h5py.Dataset if loaded lazily
+    rotations = group_data['rotations']
     unit = group_data['unit']
     sample_rate = group_data['sample_rate']
+    n_frames = len(translations)
 
     # Create title
     if title is None:
-        title = f"Trajectory: {group_name}\n({len(T_t)} frames at {sample_rate} Hz)"
+        title = f"Trajectory: {group_name}\n({n_frames} frames at {sample_rate} Hz)"
 
     # Create 3D plot
-    fig = plt.figure(figsize=(12, 9))
-    ax = fig.add_subplot(111, projection='3d')
+    if ax is None:
+        fig = plt.figure(figsize=(12, 9))
+        ax = fig.add_subplot(111, projection='3d')
+        own_figure = True
+    else:
+        fig = ax.figure  # type: ignore
+        own_figure = False
 
-    # Extract trajectory
-    trajectory = T_t[:, :3, 3]
+    # Extract trajectory (for lazily loaded data only the decimated samples are read)
+    trajectory = np.asarray(translations[::stride])
+    end_point = np.asarray(translations[n_frames - 1])
+
+    # Trajectory extent (from the decimated samples if the full data is not in memory)
+    if isinstance(translations, np.ndarray):
+        extent_points = translations
+    else:
+        extent_points = np.vstack([trajectory, end_point])
+    extent_min = extent_points.min(axis=0)
+    extent_max = extent_points.max(axis=0)
+    trajectory_range = (extent_max - extent_min).max()
 
     # Auto-scale frame size based on trajectory extent
     if frame_scale is None or frame_scale <= 0:
-        # Calculate trajectory range (max extent in any dimension)
-        trajectory_range = np.array([
-            trajectory[:, 0].max() - trajectory[:, 0].min(),
-            trajectory[:, 1].max() - trajectory[:, 1].min(),
-            trajectory[:, 2].max() - trajectory[:, 2].min()
-        ]).max()
-        
         # Set frame scale to 2-5% of trajectory range
         frame_scale = trajectory_range * 0.03
         logger.debug(f"Auto-calculated frame_scale: {frame_scale:.4f} {unit} "
                     f"(3% of trajectory range: {trajectory_range:.4f} {unit})")
 
-    # Plot trajectory line
-    ax.plot(trajectory[:, 0], trajectory[:, 1], trajectory[:, 2],
-            'b-', linewidth=2, label='Trajectory', alpha=0.7)
+    # Plot trajectory line (decimated, single contiguous line artist ending at the last sample)
+    if (n_frames - 1) % stride:
+        line_points = np.ascontiguousarray(np.vstack([trajectory, end_point]).T)
+    else:
+        line_points = np.ascontiguousarray(trajectory.T)
+    ax.plot(line_points[0], line_points[1], line_points[2],
+            'b-', linewidth=2, label='Trajectory', alpha=0.7, rasterized=rasterized)
 
     # Plot start and end points
     ax.scatter(*trajectory[0], color='green', s=100, label='Start', marker='o', zorder=10)
-    ax.scatter(*trajectory[-1], color='red', s=100, label='End', marker='s', zorder=10)
+    ax.scatter(*end_point, color='red', s=100, label='End', marker='s', zorder=10)
 
-    # Plot coordinate frames
+    # Plot coordinate frames (one batched arrow collection per axis color)
     if show_frames and frame_step > 0:
-        frame_indices = range(0, len(T_t), frame_step)
-        for idx in frame_indices:
-            origin = T_t[idx, :3, 3]
-            R_mat = T_t[idx, :3, :3]
-
-            # Draw coordinate axes
-            colors = ['r', 'g', 'b']
-            axis_labels = ['X', 'Y', 'Z']
-            for i, (color, label) in enumerate(zip(colors, axis_labels)):
-                axis = R_mat[:, i] * frame_scale
-                ax.quiver(origin[0], origin[1], origin[2],
-                         axis[0], axis[1], axis[2],
-                         color=color, alpha=0.6, arrow_length_ratio=0.3,
-                         linewidth=1.5)
+        origins = np.asarray(translations[::frame_step])
+        R_mats = _to_rotation_matrices(rotations[::frame_step])
+
+        # Draw coordinate axes
+        colors = ['r', 'g', 'b']
+        for i, color in enumerate(colors):
+            axis = R_mats[:, :, i] * frame_scale
+            ax.quiver(origins[:, 0], origins[:, 1], origins[:, 2],
+                      axis[:, 0], axis[:, 1], axis[:, 2],
+                      color=color, alpha=0.6, arrow_length_ratio=0.3,
+                      linewidth=1.5, rasterized=rasterized)
 
     # Set labels and title
     ax.set_xlabel(f'X [{unit}]')
@@ -1297,41 +1446,35 @@ def visualize_hdf5_trajectory(filename: Union[str, Path],
     ax.grid(True, alpha=0.3)
 
     # Equal aspect ratio
-    max_range = np.array([
-        trajectory[:, 0].max() - trajectory[:, 0].min(),
-        trajectory[:, 1].max() - trajectory[:, 1].min(),
-        trajectory[:, 2].max() - trajectory[:, 2].min()
-    ]).max() / 2.0
-
-    mid_x = (trajectory[:, 0].max() + trajectory[:, 0].min()) * 0.5
-    mid_y = (trajectory[:, 1].max() + trajectory[:, 1].min()) * 0.5
-    mid_z = (trajectory[:, 2].max() + trajectory[:, 2].min()) * 0.5
+    max_range = trajectory_range / 2.0
+    mid_x, mid_y, mid_z = (extent_max + extent_min) * 0.5
 
     ax.set_xlim(mid_x - max_range, mid_x + max_range)
     ax.set_ylim(mid_y - max_range, mid_y + max_range)
     ax.set_zlim(mid_z - max_range, mid_z + max_range)  # type: ignore
 
-    plt.tight_layout()
+    if own_figure:
+        plt.tight_layout()
 
     # Save if requested
     if save_path:
-        save_path = Path(save_path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_path = _save_figure(fig, save_path)
         logger.info(f"Saved trajectory plot to {save_path}")
 
     return fig, ax
 
 
-def compare_hdf5_trajectories(filename: Union[str, Path],
+def compare_hdf5_trajectories(filename: Union[str, Path, h5py.File],
                               group_names: Optional[List[str]] = None,
                               component: str = 'translations',
-                              save_path: Optional[Union[str, Path]] = None) -> Tuple[Figure, Axes]:
+                              save_path: Optional[Union[str, Path]] = None,
+                              data: Optional[Dict[str, any]] = None,  # type: ignore
+                              axes: Optional[Sequence[Axes]] = None) -> Tuple[Figure, Axes]:
     """
     Compare multiple trajectories from HDF5 file (e.g., raw vs smoothed).
 
     Args:
-        filename: Path to HDF5 file
+        filename: Path to HDF5 file or an open h5py.File handle
         group_names: List of groups to compare (None = all groups)
         component: What to plot:
             - 'translations' - X, Y, Z translations
@@ -1342,6 +1485,10 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
             - 'angular_velocity' - Angular velocity (1st rotational derivative)
             - 'angular_acceleration' - Angular acceleration (2nd rotational derivative)
         save_path: Optional path to save the figure
+        data: Data already returned by load_hdf5_transformations(as_matrices=True).
+            If given, the file is not read again.
+        axes: Three existing axes (X, Y, Z) to draw into (None = create a new figure).
+            Allows combining several comparisons in one figure.
 
     Returns:
         Figure and Axes objects
@@ -1357,7 +1504,9 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
         >>> plt.show()
     """
     # Load data
-    data = load_hdf5_transformations(filename, as_matrices=True)
+    if data is None:
+        data = load_hdf5_transformations(filename, as_matrices=True,
+                                         precompute_euler=(component == 'rotations_euler'))
 
     if not data:
         raise ValueError(f"No data loaded from {filename}")
@@ -1371,25 +1520,20 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
         if gname not in data:
             raise ValueError(f"Group '{gname}' not found in HDF5 file")
 
-    # Create figure
+    # Select labels for the component
     if component == 'translations':
-        fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
         labels = ['X', 'Y', 'Z']
         ylabel_base = 'Translation'
     elif component == 'rotations_euler':
-        fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
         labels = ['Roll (X)', 'Pitch (Y)', 'Yaw (Z)']
         ylabel_base = 'Rotation'
     elif component == 'rotations_rotvec':
-        fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
         labels = ['ωX', 'ωY', 'ωZ']
         ylabel_base = 'Rotation Vector'
     elif component in ['translational_velocity', 'translational_acceleration']:
-        fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
         labels = ['X', 'Y', 'Z']
         ylabel_base = 'Translational Velocity' if 'velocity' in component else 'Translational Acceleration'
     elif component in ['angular_velocity', 'angular_acceleration']:
-        fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
         labels = ['X', 'Y', 'Z']
         ylabel_base = 'Angular Velocity' if 'velocity' in component else 'Angular Acceleration'
     else:
@@ -1399,6 +1543,16 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
             "'angular_velocity', or 'angular_acceleration'"
         )
 
+    # Create figure
+    if axes is None:
+        fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
+        own_figure = True
+    else:
+        if len(axes) != 3:
+            raise ValueError("axes must contain exactly 3 Axes (X, Y, Z)")
+        fig = axes[0].figure  # type: ignore
+        own_figure = False
+
     # Get unit from first group
     unit = data[group_names[0]]['unit']
     sample_rate = data[group_names[0]]['sample_rate']
@@ -1411,22 +1565,18 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
 
         # Prepare data based on component
         if component == 'translations':
-            plot_data = group_data['translations']
+            plot_data = np.asarray(group_data['translations'])
             unit_str = unit
         elif component == 'rotations_euler':
-            # Convert rotation matrices to Euler angles
-            rotations = group_data['rotations']
-            plot_data = np.array([
-                R.from_matrix(rot).as_euler('xyz', degrees=True)
-                for rot in rotations
-            ])
+            # Use cached Euler angles if available, otherwise convert rotation matrices
+            if 'rotations_euler' in group_data:
+                plot_data = group_data['rotations_euler']
+            else:
+                plot_data = _to_euler_angles(group_data['rotations'])
             unit_str = 'deg'
         elif component == 'rotations_rotvec':
-            rotations = group_data['rotations']
-            plot_data = np.array([
-                R.from_matrix(rot).as_rotvec(degrees=True)
-                for rot in rotations
-            ])
+            rotations = _to_rotation_matrices(group_data['rotations'])
+            plot_data = R.from_matrix(rotations).as_rotvec(degrees=True)
             unit_str = 'deg'
         elif component in ['translational_velocity', 'translational_acceleration', 
                           'angular_velocity', 'angular_acceleration']:
@@ -1435,7 +1585,7 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
                 logger.warning(f"Derivative '{component}' not found in group '{gname}', skipping")
                 continue
             
-            plot_data = group_data['derivatives'][component]
+            plot_data = np.asarray(group_data['derivatives'][component])
             
             # Determine units
             if 'translational' in component:
@@ -1462,14 +1612,71 @@ def compare_hdf5_trajectories(filename: Union[str, Path],
             ax.legend()
 
     axes[-1].set_xlabel('Time [s]')
-    fig.suptitle(f'Trajectory Comparison: {component}', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    if own_figure:
+        fig.suptitle(f'Trajectory Comparison: {component}', fontsize=14, fontweight='bold')
+        plt.tight_layout()
+    else:
+        axes[0].set_title(f'Trajectory Comparison: {component}', fontweight='bold')
+
+    # Save if requested
+    if save_path:
+        save_path = _save_figure(fig, save_path)
+        logger.info(f"Saved comparison plot to {save_path}")
+
+    return fig, axes
+
+
+def compare_hdf5_trajectories_multi(filename: Union[str, Path, h5py.File],
+                                    group_names: Optional[List[str]] = None,
+                                    components: Sequence[str] = ('translations', 'rotations_euler'),
+                                    save_path: Optional[Union[str, Path]] = None,
+                                    data: Optional[Dict[str, any]] = None,  # type: ignore
+                                    fig: Optional[Figure] = None) -> Tuple[Figure, np.ndarray]:
+    """
+    Compare several components of multiple trajectories in a single figure.
+
+    Each component gets one column of X/Y/Z subplots (see compare_hdf5_trajectories()).
+    All subplots share the time axis, so layout and autoscaling are computed once
+    for the whole figure.
+
+    Args:
+        filename: Path to HDF5 file or an open h5py.File handle
+        group_names: List of groups to compare (None = all groups)
+        components: Components to plot, one column each (see compare_hdf5_trajectories())
+        save_path: Optional path to save the figure
+        data: Data already returned by load_hdf5_transformations(as_matrices=True).
+            If given, the file is not read again.
+        fig: Existing figure or subfigure to draw into (None = create a new figure)
+
+    Returns:
+        Figure and (3, len(components)) array of Axes
+
+    Example:
+        >>> fig, axes = hlp.compare_hdf5_trajectories_multi('jaw_motion.h5',
+        ...     components=['translations', 'rotations_euler', 'translational_velocity'])
+        >>> plt.show()
+    """
+    if not components:
+        raise ValueError("At least one component must be given")
+
+    # Load data once for all components
+    if data is None:
+        data = load_hdf5_transformations(filename, as_matrices=True,
+                                         precompute_euler='rotations_euler' in components)
+
+    if fig is None:
+        fig = plt.figure(figsize=(5 * len(components) + 2, 9), layout='constrained')
+        fig.suptitle('Trajectory Comparison', fontsize=14, fontweight='bold')
+
+    axes = fig.subplots(3, len(components), sharex=True, squeeze=False)
+
+    for col, component in enumerate(components):
+        compare_hdf5_trajectories(filename, group_names=group_names, component=component,
+                                  data=data, axes=axes[:, col])
 
     # Save if requested
     if save_path:
-        save_path = Path(save_path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_path = _save_figure(fig, save_path)
         logger.info(f"Saved comparison plot to {save_path}")
 
     return fig, axes
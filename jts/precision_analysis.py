@@ -30,7 +30,6 @@ __url__ = "https://github.com/paulotto/jaw_tracking_system"
 
 import h5py
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 from typing import Dict, Tuple, Optional, List, Union
@@ -39,6 +38,11 @@ from scipy import signal
 from scipy.spatial.transform import Rotation as R
 from scipy.stats import norm
 
+try:
+    import pandas as pd
+except ImportError:
+    raise ImportError("pandas package required. Install with: pip install jaw-tracking-system[full]")
+
 # Import the helper module for logging
 from . import helper as hlp
 
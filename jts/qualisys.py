@@ -26,7 +26,6 @@ from typing import List, Dict, Tuple, Optional, Union, Any
 from dataclasses import dataclass
 
 from scipy.io import loadmat
-from sklearn.decomposition import PCA
 
 # Import general utilities from helper module
 from . import helper as hlp
@@ -188,13 +187,16 @@ class QualysisData:
         # Determine origin
         origin = np.mean(points, axis=0) if origin_index == -1 else points[origin_index]
 
-        # Center points and compute PCA
+        # Center points and compute PCA (principal axes via SVD of the mean-centered points)
         centered_points = points - origin
-        pca = PCA(n_components=3)
-        pca.fit(centered_points)
+        _, _, components = np.linalg.svd(centered_points - centered_points.mean(axis=0), full_matrices=False)
+
+        # Deterministic signs: largest absolute entry of each principal axis is positive
+        max_abs_idx = np.argmax(np.abs(components), axis=1)
+        components *= np.sign(components[np.arange(components.shape[0]), max_abs_idx])[:, np.newaxis]
 
         # Get orthonormal coordinate system
-        coord_system = pca.components_.T
+        coord_system = components.T
         coord_system = hlp.ensure_orthonormal(coord_system)
 
         # Build transformation matrix
@@ -21,13 +21,15 @@ setup(
     packages=["jts"], # find_namespace_packages(),
     include_package_data=True,
     install_requires=[
-        "h5py",
+        "h5py>=3.8",
         "numpy",
         "scipy",
-        "pandas",
-        "scikit-learn",
         "matplotlib"
     ],
+    extras_require={
+        # pandas is only needed by jts.precision_analysis
+        "full": ["pandas"]
+    },
     python_requires=">=3.10",
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -22,6 +22,7 @@ __date__ = '16.10.2025'
 __url__ = "https://github.com/paulotto/jaw_tracking_system"
 
 import numpy as np
+import pytest
 
 from jts import helper as hlp
 
@@ -228,6 +229,15 @@ def test_load_hdf5_transformations_as_matrices(tmp_path):
         rtol=1e-5, atol=1e-6
     )
 
+    # Check that Euler angles are precomputed (rotation about Z by i * 0.1 rad)
+    euler = data['trajectory']['rotations_euler']
+    assert euler.shape == (N, 3)
+    np.testing.assert_allclose(euler[:, 2], np.degrees(np.arctan2(np.sin(np.arange(N) * 0.1),
+                                                                   np.cos(np.arange(N) * 0.1))), atol=1e-6)
+
+    data_no_euler = hlp.load_hdf5_transformations(test_file, precompute_euler=False)
+    assert 'rotations_euler' not in data_no_euler['trajectory']
+
 
 def test_load_hdf5_transformations_as_quaternions(tmp_path):
     """
@@ -282,6 +292,184 @@ def test_load_hdf5_transformations_specific_group(tmp_path):
     assert data['group1']['transformations'].shape == (N, 4, 4)
 
 
+def test_hdf5_functions_with_open_file_and_preloaded_data(tmp_path):
+    """
+    Test sharing a single open h5py.File and preloaded data:
+    - inspect_hdf5 and load_hdf5_transformations accept an open handle
+    - The handle is left open for further use
+    - visualize/compare functions reuse preloaded data without reading the file
+    """
+    import h5py
+    import matplotlib.pyplot as plt
+
+    N = 40
+    T_t = np.tile(np.eye(4), (N, 1, 1))
+    T_t[:, :3, 3] = np.random.randn(N, 3)
+
+    test_file = tmp_path / "test_open_file.h5"
+    hlp.store_transformations([T_t], [100.0], test_file, group_names=['traj'])
+
+    with h5py.File(test_file, 'r') as f:
+        info = hlp.inspect_hdf5(f, verbose=False)
+        data = hlp.load_hdf5_transformations(f, as_matrices=True)
+        assert f.id.valid
+
+    assert info['traj']['num_frames'] == N
+    np.testing.assert_allclose(data['traj']['transformations'], T_t)
+
+    # File path is never opened when data is passed in
+    missing_file = tmp_path / "does_not_exist.h5"
+    fig, ax = hlp.visualize_hdf5_trajectory(missing_file, show_frames=False, data=data)
+    plt.close(fig)
+    fig, axes = hlp.compare_hdf5_trajectories(missing_file, component='translations', data=data)
+    assert len(axes) == 3  # type: ignore
+    plt.close(fig)
+
+
+def test_load_hdf5_transformations_small_chunks_warning(tmp_path, caplog):
+    """
+    Test loading and inspecting a chunked file:
+    - Data is read correctly with a custom chunk cache size
+    - A warning is logged for chunks smaller than MIN_CHUNK_FRAMES
+    - inspect_hdf5 reports chunk shapes and warns for chunks below MIN_CHUNK_BYTES
+    """
+    import h5py
+
+    N = 500
+    translations = np.random.randn(N, 3)
+    quaternions = np.tile([1.0, 0.0, 0.0, 0.0], (N, 1))
+
+    test_file = tmp_path / "test_chunked.h5"
+    with h5py.File(test_file, 'w') as f:
+        group = f.create_group('chunked')
+        group.attrs['sample_rate'] = 100.0
+        group.create_dataset('translations', data=translations, chunks=(16, 3))
+        group.create_dataset('rotations', data=quaternions, chunks=(N, 4))
+
+    with caplog.at_level('WARNING', logger='jts.helper'):
+        data = hlp.load_hdf5_transformations(test_file, chunk_cache_mb=8)
+
+    np.testing.assert_allclose(data['chunked']['translations'], translations)
+    np.testing.assert_allclose(data['chunked']['rotations'], np.tile(np.eye(3), (N, 1, 1)))
+    messages = [record.getMessage() for record in caplog.records]
+    assert any('translations' in msg and 'small chunks' in msg for msg in messages)
+    assert not any('rotations' in msg for msg in messages)
+
+    caplog.clear()
+    with caplog.at_level('WARNING', logger='jts.helper'):
+        info = hlp.inspect_hdf5(test_file, verbose=False)
+
+    assert info['chunked']['datasets']['translations']['chunks'] == (16, 3)
+    messages = [record.getMessage() for record in caplog.records]
+    assert any('chunked/translations' in msg and '384 bytes' in msg for msg in messages)
+    assert not any('rotations' in msg for msg in messages)
+
+
+def test_load_hdf5_transformations_short_recording_no_chunk_warning(tmp_path, caplog):
+    """
+    Test that a short recording stored as a single chunk is not reported as small-chunked
+    by load_hdf5_transformations or inspect_hdf5.
+    """
+    import h5py
+
+    N = 100
+    test_file = tmp_path / "test_single_chunk.h5"
+    with h5py.File(test_file, 'w') as f:
+        group = f.create_group('short')
+        group.attrs['sample_rate'] = 100.0
+        group.create_dataset('translations', data=np.random.randn(N, 3), chunks=(min(N, 32768), 3))
+        group.create_dataset('rotations', data=np.tile([1.0, 0.0, 0.0, 0.0], (N, 1)), chunks=(min(N, 32768), 4))
+
+    with caplog.at_level('WARNING', logger='jts.helper'):
+        data = hlp.load_hdf5_transformations(test_file)
+
+    assert len(data['short']['translations']) == N
+    assert not any('small chunks' in record.getMessage() for record in caplog.records)
+
+    caplog.clear()
+    with caplog.at_level('WARNING', logger='jts.helper'):
+        info = hlp.inspect_hdf5(test_file, verbose=False)
+
+    assert info['short']['datasets']['translations']['chunks'] == (N, 3)
+    assert not any('small chunks' in record.getMessage() for record in caplog.records)
+
+
+def test_load_hdf5_transformations_invalid_rotations(tmp_path):
+    """
+    Test precomputed Euler angles for files with invalid or gimbal-locked rotations:
+    - A NaN quaternion row (e.g. a tracking dropout) loads with as_matrices=False
+    - Its Euler angles are NaN, valid rows are converted
+    - No gimbal lock warning is emitted
+    """
+    import h5py
+    import warnings
+    from scipy.spatial.transform import Rotation as R
+
+    N = 10
+    quaternions = np.tile([1.0, 0.0, 0.0, 0.0], (N, 1))
+    quaternions[3] = np.nan
+    quaternions[5] = R.from_euler('y', 90, degrees=True).as_quat()[[3, 0, 1, 2]]  # Gimbal lock
+
+    test_file = tmp_path / "test_invalid_rotations.h5"
+    with h5py.File(test_file, 'w') as f:
+        group = f.create_group('dropout')
+        group.attrs['sample_rate'] = 100.0
+        group.create_dataset('translations', data=np.zeros((N, 3)))
+        group.create_dataset('rotations', data=quaternions)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        data = hlp.load_hdf5_transformations(test_file, as_matrices=False)
+
+    euler = data['dropout']['rotations_euler']
+    assert np.isnan(euler[3]).all()
+    assert np.isfinite(np.delete(euler, 3, axis=0)).all()
+    np.testing.assert_allclose(euler[5, 1], 90.0)
+    np.testing.assert_allclose(euler[0], 0.0)
+
+
+def test_load_hdf5_transformations_lazy(tmp_path):
+    """
+    Test load_hdf5_transformations with lazy=True:
+    - Returns h5py datasets instead of in-memory arrays
+    - Requires an open file handle (a path raises ValueError)
+    - Lazily loaded data can be visualized and compared while the file is open
+    """
+    import h5py
+    import matplotlib.pyplot as plt
+
+    N = 60
+    T_t = np.tile(np.eye(4), (N, 1, 1))
+    T_t[:, :3, 3] = np.random.randn(N, 3)
+
+    test_file = tmp_path / "test_lazy.h5"
+    hlp.store_transformations(
+        [T_t], [100.0], test_file,
+        group_names=['lazy_group'],
+        derivative_order=1
+    )
+
+    with pytest.raises(ValueError):
+        hlp.load_hdf5_transformations(test_file, lazy=True)
+
+    with h5py.File(test_file, 'r') as f:
+        data = hlp.load_hdf5_transformations(f, lazy=True)
+        group = data['lazy_group']
+
+        assert isinstance(group['translations'], h5py.Dataset)
+        assert isinstance(group['rotations'], h5py.Dataset)
+        assert isinstance(group['derivatives']['translational_velocity'], h5py.Dataset)
+        assert group['rotations'].shape == (N, 4)  # Stored format (quaternions)
+        assert 'transformations' not in group
+        np.testing.assert_allclose(group['translations'][::10], T_t[::10, :3, 3])
+
+        fig, ax = hlp.visualize_hdf5_trajectory(test_file, frame_step=10, stride=5, data=data)
+        plt.close(fig)
+        fig, axes = hlp.compare_hdf5_trajectories(test_file, component='rotations_euler', data=data)
+        assert len(axes) == 3  # type: ignore
+        plt.close(fig)
+
+
 def test_load_hdf5_transformations_with_derivatives(tmp_path):
     """
     Test loading transformations with derivatives:
@@ -348,6 +536,8 @@ def test_visualize_hdf5_trajectory(tmp_path):
     import matplotlib.pyplot as plt
     assert fig is not None
     assert ax is not None
+    # Start/end markers plus one batched arrow collection per frame axis (X, Y, Z)
+    assert len(ax.collections) == 2 + 3
     plt.close(fig)
     
     # Test visualization with saving
@@ -363,6 +553,21 @@ def test_visualize_hdf5_trajectory(tmp_path):
     assert save_path.exists()
     plt.close(fig2)
 
+    # Test decimated trajectory line
+    fig3, ax3 = hlp.visualize_hdf5_trajectory(
+        test_file,
+        show_frames=False,
+        stride=10,
+        rasterized=True
+    )
+
+    # Every 10th sample plus the last one, so the line reaches the end marker
+    line_x, line_y, line_z = ax3.lines[0].get_data_3d()
+    assert len(line_x) == N // 10 + 1
+    np.testing.assert_allclose([line_x[-1], line_y[-1], line_z[-1]], T_t[-1, :3, 3])
+    assert ax3.lines[0].get_rasterized()
+    plt.close(fig3)
+
 
 def test_compare_hdf5_trajectories_translations(tmp_path):
     """
@@ -411,6 +616,26 @@ def test_compare_hdf5_trajectories_translations(tmp_path):
     assert len(axes) == 3  # type: ignore # X, Y, Z subplots
     plt.close(fig)
 
+    # Draw into axes of an existing figure (shared with a 3D trajectory plot)
+    shared_fig = plt.figure()
+    gs = shared_fig.add_gridspec(3, 2)
+    _, ax_3d = hlp.visualize_hdf5_trajectory(
+        test_file, group_name='raw', show_frames=False,
+        ax=shared_fig.add_subplot(gs[:, 0], projection='3d')
+    )
+    col_axes = [shared_fig.add_subplot(gs[row, 1]) for row in range(3)]
+    fig2, axes2 = hlp.compare_hdf5_trajectories(
+        test_file,
+        group_names=['raw', 'smooth'],
+        component='translations',
+        axes=col_axes
+    )
+
+    assert fig2 is shared_fig
+    assert ax_3d.figure is shared_fig
+    assert all(len(ax.lines) == 2 for ax in axes2)  # type: ignore # one line per group
+    plt.close(shared_fig)
+
 
 def test_compare_hdf5_trajectories_rotations_euler(tmp_path):
     """
@@ -480,3 +705,81 @@ def test_compare_hdf5_trajectories_rotations_rotvec(tmp_path):
     assert fig is not None
     assert len(axes) == 3  # type: ignore
     plt.close(fig)
+
+
+def test_compare_hdf5_trajectories_multi(tmp_path):
+    """
+    Test compare_hdf5_trajectories_multi:
+    - Plots several components into one figure with a (3, n_components) axes grid
+    - Draws into a subfigure of an existing figure
+    - Tests saving to file
+    """
+    import matplotlib.pyplot as plt
+
+    N = 50
+    T_t = np.tile(np.eye(4), (N, 1, 1))
+    T_t[:, :3, 3] = np.random.randn(N, 3)
+
+    test_file = tmp_path / "test_compare_multi.h5"
+    hlp.store_transformations(
+        [T_t, T_t], [100.0, 100.0], test_file,
+        group_names=['raw', 'smooth'],
+        derivative_order=1
+    )
+
+    components = ['translations', 'rotations_euler', 'translational_velocity']
+    save_path = tmp_path / "comparison_multi.png"
+    fig, axes = hlp.compare_hdf5_trajectories_multi(
+        test_file,
+        components=components,
+        save_path=save_path
+    )
+
+    assert axes.shape == (3, len(components))
+    assert all(len(ax.lines) == 2 for ax in axes.flat)  # one line per group
+    assert save_path.exists()
+    plt.close(fig)
+
+    # Draw into a subfigure next to other plots
+    parent_fig = plt.figure()
+    _, sub_fig = parent_fig.subfigures(1, 2)
+    fig2, axes2 = hlp.compare_hdf5_trajectories_multi(test_file, components=['translations'], fig=sub_fig)
+
+    assert fig2 is sub_fig
+    assert axes2.shape == (3, 1)
+    plt.close(parent_fig)
+
+
+def test_hdf5_plots_save_from_subfigure(tmp_path):
+    """
+    Test saving plots drawn into the axes of a subfigure:
+    - visualize_hdf5_trajectory and compare_hdf5_trajectories save the top-level figure
+    """
+    import matplotlib.pyplot as plt
+
+    N = 50
+    T_t = np.tile(np.eye(4), (N, 1, 1))
+    T_t[:, :3, 3] = np.random.randn(N, 3)
+
+    test_file = tmp_path / "test_subfigure.h5"
+    hlp.store_transformations([T_t], [100.0], test_file, group_names=['traj'])
+
+    parent_fig = plt.figure()
+    fig_3d, fig_compare = parent_fig.subfigures(1, 2)
+
+    save_path_3d = tmp_path / "subfigure_trajectory.png"
+    fig, _ = hlp.visualize_hdf5_trajectory(
+        test_file, show_frames=False, save_path=save_path_3d,
+        ax=fig_3d.add_subplot(projection='3d')
+    )
+    assert fig is fig_3d
+    assert save_path_3d.exists()
+
+    save_path_compare = tmp_path / "subfigure_comparison.png"
+    fig, _ = hlp.compare_hdf5_trajectories(
+        test_file, component='translations', save_path=save_path_compare,
+        axes=fig_compare.subplots(3, 1, sharex=True)
+    )
+    assert fig is fig_compare
+    assert save_path_compare.exists()
+    plt.close(parent_fig)
@@ -0,0 +1,90 @@
+"""
+Test suite for the jts._kernels module.
+
+This suite includes tests for:
+- Magnitude statistics (min, max, mean) of row vectors
+- Agreement of the NumPy fallback with the (optional) Numba kernel
+- Switching to the Numba kernel for arrays with at least NUMBA_MIN_ROWS rows
+"""
+
+__author__ = "Paul-Otto Müller"
+__copyright__ = "Copyright 2025, Paul-Otto Müller"
+__credits__ = ["Paul-Otto Müller"]
+__license__ = "GNU GPLv3"
+__version__ = "1.1.0"
+__maintainer__ = "Paul-Otto Müller"
+__status__ = "Development"
+__date__ = '16.10.2025'
+__url__ = "https://github.com/paulotto/jaw_tracking_system"
+
+import numpy as np
+import pytest
+
+from jts import _kernels as krn
+from jts import helper as hlp
+
+
+def test_mag_minmaxmean():
+    """
+    Test the mag_minmaxmean function:
+    - Compares against np.linalg.norm based reductions for (N, 3) and (N, 4) arrays.
+    - Spans several blocks of the NumPy fallback.
+    - Checks that 1D arrays are treated as (N, 1).
+    """
+    for shape in [(10, 3), (2 * krn.BLOCK_SIZE + 7, 4)]:
+        a = np.random.randn(*shape)
+        magnitude = np.linalg.norm(a, axis=1)
+        expected = (magnitude.min(), magnitude.max(), magnitude.mean())
+
+        np.testing.assert_allclose(krn.mag_minmaxmean(a), expected, rtol=1e-10)
+        np.testing.assert_allclose(krn._mag_minmaxmean_numpy(a), expected, rtol=1e-10)
+        if krn.NUMBA_AVAILABLE:
+            np.testing.assert_allclose(krn._mag_minmaxmean_numba(a), expected, rtol=1e-10)
+
+    np.testing.assert_allclose(krn.mag_minmaxmean(np.array([3.0, -4.0])), (3.0, 4.0, 3.5))
+
+    with pytest.raises(ValueError):
+        krn.mag_minmaxmean(np.empty((0, 3)))
+
+    # Public API re-export
+    assert hlp.mag_minmaxmean is krn.mag_minmaxmean
+
+
+def test_mag_minmaxmean_non_finite():
+    """
+    Test mag_minmaxmean on non-finite input:
+    - A NaN row makes all statistics NaN, as for np.linalg.norm based reductions.
+    - An inf row gives an infinite max and mean.
+    - The NumPy fallback and the Numba kernel (if installed) agree.
+    """
+    for value in [np.nan, np.inf]:
+        a = np.random.randn(1000, 3)
+        a[500, 1] = value
+        magnitude = np.linalg.norm(a, axis=1)
+        expected = (magnitude.min(), magnitude.max(), magnitude.mean())
+
+        np.testing.assert_allclose(krn.mag_minmaxmean(a), expected, rtol=1e-10)
+        np.testing.assert_allclose(krn._mag_minmaxmean_numpy(a), expected, rtol=1e-10)
+
+        if krn.NUMBA_AVAILABLE:
+            np.testing.assert_allclose(krn._mag_minmaxmean_numba(a), expected, rtol=1e-10)
+
+
+def test_mag_minmaxmean_numba_threshold(monkeypatch):
+    """
+    Test the choice of implementation in mag_minmaxmean:
+    - Arrays below NUMBA_MIN_ROWS use the NumPy implementation.
+    - Larger arrays use the Numba kernel if Numba is available.
+    """
+    calls = []
+    monkeypatch.setattr(krn, 'NUMBA_AVAILABLE', True)
+    monkeypatch.setattr(krn, 'NUMBA_MIN_ROWS', 100)
+    monkeypatch.setattr(krn, '_mag_minmaxmean_numba', lambda a: calls.append(len(a)) or (0.0, 0.0, 0.0))
+
+    a = np.random.randn(99, 3)
+    magnitude = np.linalg.norm(a, axis=1)
+    np.testing.assert_allclose(krn.mag_minmaxmean(a), (magnitude.min(), magnitude.max(), magnitude.mean()))
+    assert calls == []
+
+    assert krn.mag_minmaxmean(np.random.randn(100, 3)) == (0.0, 0.0, 0.0)
+    assert calls == [100]